@@ -0,0 +1,175 @@
+# Generated by generate_validator.py from EXAM_SCHEMA - do not edit.
+SCHEMA_HASH = "937d53a04cb1f2af6dedbf4dc118e6cb9d2030d52e29ad75153438098a90d420"
+
+VERSION = "2.22.2"
+from decimal import Decimal
+from fastjsonschema import JsonSchemaValueException, JsonSchemaValuesException
+
+
+NoneType = type(None)
+
+def validate(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object")
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['id', 'season', 'year', 'sections']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain ")
+        data_keys = set(data.keys())
+        if "id" in data_keys:
+            data_keys.remove("id")
+            data__id = data["id"]
+            if not isinstance(data__id, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".id must be string")
+        if "season" in data_keys:
+            data_keys.remove("season")
+            data__season = data["season"]
+            if not (isinstance(data__season, str) and data__season == 'spring' or isinstance(data__season, str) and data__season == 'summer' or isinstance(data__season, str) and data__season == 'fall' or isinstance(data__season, str) and data__season == 'winter'):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".season must be one of ['spring', 'summer', 'fall', 'winter']")
+        if "year" in data_keys:
+            data_keys.remove("year")
+            data__year = data["year"]
+            if not isinstance(data__year, (int)) and not (isinstance(data__year, float) and data__year.is_integer()) or isinstance(data__year, bool):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".year must be integer")
+            if isinstance(data__year, (int, float, Decimal)):
+                if data__year < 2000:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".year must be bigger than or equal to 2000")
+                if data__year > 2100:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".year must be smaller than or equal to 2100")
+        if "hebrewName" in data_keys:
+            data_keys.remove("hebrewName")
+            data__hebrewName = data["hebrewName"]
+            if not isinstance(data__hebrewName, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".hebrewName must be string")
+        if "sections" in data_keys:
+            data_keys.remove("sections")
+            data__sections = data["sections"]
+            if not isinstance(data__sections, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".sections must be array")
+            data__sections_is_list = isinstance(data__sections, (list, tuple))
+            if data__sections_is_list:
+                data__sections_len = len(data__sections)
+                for data__sections_x, data__sections_item in enumerate(data__sections):
+                    if not isinstance(data__sections_item, (dict)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".sections[{data__sections_x}]".format(**locals()) + " must be object")
+                    data__sections_item_is_dict = isinstance(data__sections_item, dict)
+                    if data__sections_item_is_dict:
+                        data__sections_item__missing_keys = set(['id', 'examId', 'type', 'order', 'questions']) - data__sections_item.keys()
+                        if data__sections_item__missing_keys:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".sections[{data__sections_x}]".format(**locals()) + " must contain ")
+                        data__sections_item_keys = set(data__sections_item.keys())
+                        if "id" in data__sections_item_keys:
+                            data__sections_item_keys.remove("id")
+                            data__sections_item__id = data__sections_item["id"]
+                            if not isinstance(data__sections_item__id, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".sections[{data__sections_x}].id".format(**locals()) + " must be string")
+                        if "examId" in data__sections_item_keys:
+                            data__sections_item_keys.remove("examId")
+                            data__sections_item__examId = data__sections_item["examId"]
+                            if not isinstance(data__sections_item__examId, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".sections[{data__sections_x}].examId".format(**locals()) + " must be string")
+                        if "type" in data__sections_item_keys:
+                            data__sections_item_keys.remove("type")
+                            data__sections_item__type = data__sections_item["type"]
+                            if not (isinstance(data__sections_item__type, str) and data__sections_item__type == 'quantitative' or isinstance(data__sections_item__type, str) and data__sections_item__type == 'verbal' or isinstance(data__sections_item__type, str) and data__sections_item__type == 'english'):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".sections[{data__sections_x}].type".format(**locals()) + " must be one of ['quantitative', 'verbal', 'english']")
+                        if "order" in data__sections_item_keys:
+                            data__sections_item_keys.remove("order")
+                            data__sections_item__order = data__sections_item["order"]
+                            if not (isinstance(data__sections_item__order, (int, float)) and not isinstance(data__sections_item__order, bool) and data__sections_item__order == 1 or isinstance(data__sections_item__order, (int, float)) and not isinstance(data__sections_item__order, bool) and data__sections_item__order == 2):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".sections[{data__sections_x}].order".format(**locals()) + " must be one of [1, 2]")
+                        if "timeLimitMinutes" in data__sections_item_keys:
+                            data__sections_item_keys.remove("timeLimitMinutes")
+                            data__sections_item__timeLimitMinutes = data__sections_item["timeLimitMinutes"]
+                            if not isinstance(data__sections_item__timeLimitMinutes, (int)) and not (isinstance(data__sections_item__timeLimitMinutes, float) and data__sections_item__timeLimitMinutes.is_integer()) or isinstance(data__sections_item__timeLimitMinutes, bool):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".sections[{data__sections_x}].timeLimitMinutes".format(**locals()) + " must be integer")
+                        if "questions" in data__sections_item_keys:
+                            data__sections_item_keys.remove("questions")
+                            data__sections_item__questions = data__sections_item["questions"]
+                            if not isinstance(data__sections_item__questions, (list, tuple)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".sections[{data__sections_x}].questions".format(**locals()) + " must be array")
+                            data__sections_item__questions_is_list = isinstance(data__sections_item__questions, (list, tuple))
+                            if data__sections_item__questions_is_list:
+                                data__sections_item__questions_len = len(data__sections_item__questions)
+                                for data__sections_item__questions_x, data__sections_item__questions_item in enumerate(data__sections_item__questions):
+                                    if not isinstance(data__sections_item__questions_item, (dict)):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".sections[{data__sections_x}].questions[{data__sections_item__questions_x}]".format(**locals()) + " must be object")
+                                    data__sections_item__questions_item_is_dict = isinstance(data__sections_item__questions_item, dict)
+                                    if data__sections_item__questions_item_is_dict:
+                                        data__sections_item__questions_item__missing_keys = set(['id', 'sectionId', 'number', 'stem', 'options']) - data__sections_item__questions_item.keys()
+                                        if data__sections_item__questions_item__missing_keys:
+                                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".sections[{data__sections_x}].questions[{data__sections_item__questions_x}]".format(**locals()) + " must contain ")
+                                        data__sections_item__questions_item_keys = set(data__sections_item__questions_item.keys())
+                                        if "id" in data__sections_item__questions_item_keys:
+                                            data__sections_item__questions_item_keys.remove("id")
+                                            data__sections_item__questions_item__id = data__sections_item__questions_item["id"]
+                                            if not isinstance(data__sections_item__questions_item__id, (str)):
+                                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".sections[{data__sections_x}].questions[{data__sections_item__questions_x}].id".format(**locals()) + " must be string")
+                                        if "sectionId" in data__sections_item__questions_item_keys:
+                                            data__sections_item__questions_item_keys.remove("sectionId")
+                                            data__sections_item__questions_item__sectionId = data__sections_item__questions_item["sectionId"]
+                                            if not isinstance(data__sections_item__questions_item__sectionId, (str)):
+                                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".sections[{data__sections_x}].questions[{data__sections_item__questions_x}].sectionId".format(**locals()) + " must be string")
+                                        if "number" in data__sections_item__questions_item_keys:
+                                            data__sections_item__questions_item_keys.remove("number")
+                                            data__sections_item__questions_item__number = data__sections_item__questions_item["number"]
+                                            if not isinstance(data__sections_item__questions_item__number, (int)) and not (isinstance(data__sections_item__questions_item__number, float) and data__sections_item__questions_item__number.is_integer()) or isinstance(data__sections_item__questions_item__number, bool):
+                                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".sections[{data__sections_x}].questions[{data__sections_item__questions_x}].number".format(**locals()) + " must be integer")
+                                            if isinstance(data__sections_item__questions_item__number, (int, float, Decimal)):
+                                                if data__sections_item__questions_item__number < 1:
+                                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".sections[{data__sections_x}].questions[{data__sections_item__questions_x}].number".format(**locals()) + " must be bigger than or equal to 1")
+                                        if "type" in data__sections_item__questions_item_keys:
+                                            data__sections_item__questions_item_keys.remove("type")
+                                            data__sections_item__questions_item__type = data__sections_item__questions_item["type"]
+                                            if not isinstance(data__sections_item__questions_item__type, (str)):
+                                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".sections[{data__sections_x}].questions[{data__sections_item__questions_x}].type".format(**locals()) + " must be string")
+                                        if "stem" in data__sections_item__questions_item_keys:
+                                            data__sections_item__questions_item_keys.remove("stem")
+                                            data__sections_item__questions_item__stem = data__sections_item__questions_item["stem"]
+                                            if not isinstance(data__sections_item__questions_item__stem, (str)):
+                                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".sections[{data__sections_x}].questions[{data__sections_item__questions_x}].stem".format(**locals()) + " must be string")
+                                            if isinstance(data__sections_item__questions_item__stem, str):
+                                                data__sections_item__questions_item__stem_len = len(data__sections_item__questions_item__stem)
+                                                if data__sections_item__questions_item__stem_len < 1:
+                                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".sections[{data__sections_x}].questions[{data__sections_item__questions_x}].stem".format(**locals()) + " must be longer than or equal to 1 characters")
+                                        if "options" in data__sections_item__questions_item_keys:
+                                            data__sections_item__questions_item_keys.remove("options")
+                                            data__sections_item__questions_item__options = data__sections_item__questions_item["options"]
+                                            if not isinstance(data__sections_item__questions_item__options, (list, tuple)):
+                                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".sections[{data__sections_x}].questions[{data__sections_item__questions_x}].options".format(**locals()) + " must be array")
+                                            data__sections_item__questions_item__options_is_list = isinstance(data__sections_item__questions_item__options, (list, tuple))
+                                            if data__sections_item__questions_item__options_is_list:
+                                                data__sections_item__questions_item__options_len = len(data__sections_item__questions_item__options)
+                                                if data__sections_item__questions_item__options_len < 2:
+                                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".sections[{data__sections_x}].questions[{data__sections_item__questions_x}].options".format(**locals()) + " must contain at least 2 items")
+                                                for data__sections_item__questions_item__options_x, data__sections_item__questions_item__options_item in enumerate(data__sections_item__questions_item__options):
+                                                    if not isinstance(data__sections_item__questions_item__options_item, (dict)):
+                                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".sections[{data__sections_x}].questions[{data__sections_item__questions_x}].options[{data__sections_item__questions_item__options_x}]".format(**locals()) + " must be object")
+                                                    data__sections_item__questions_item__options_item_is_dict = isinstance(data__sections_item__questions_item__options_item, dict)
+                                                    if data__sections_item__questions_item__options_item_is_dict:
+                                                        data__sections_item__questions_item__options_item__missing_keys = set(['label', 'text']) - data__sections_item__questions_item__options_item.keys()
+                                                        if data__sections_item__questions_item__options_item__missing_keys:
+                                                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".sections[{data__sections_x}].questions[{data__sections_item__questions_x}].options[{data__sections_item__questions_item__options_x}]".format(**locals()) + " must contain ")
+                                                        data__sections_item__questions_item__options_item_keys = set(data__sections_item__questions_item__options_item.keys())
+                                                        if "label" in data__sections_item__questions_item__options_item_keys:
+                                                            data__sections_item__questions_item__options_item_keys.remove("label")
+                                                            data__sections_item__questions_item__options_item__label = data__sections_item__questions_item__options_item["label"]
+                                                            if not isinstance(data__sections_item__questions_item__options_item__label, (str)):
+                                                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".sections[{data__sections_x}].questions[{data__sections_item__questions_x}].options[{data__sections_item__questions_item__options_x}].label".format(**locals()) + " must be string")
+                                                        if "text" in data__sections_item__questions_item__options_item_keys:
+                                                            data__sections_item__questions_item__options_item_keys.remove("text")
+                                                            data__sections_item__questions_item__options_item__text = data__sections_item__questions_item__options_item["text"]
+                                                            if not isinstance(data__sections_item__questions_item__options_item__text, (str)):
+                                                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".sections[{data__sections_x}].questions[{data__sections_item__questions_x}].options[{data__sections_item__questions_item__options_x}].text".format(**locals()) + " must be string")
+                                        if "correctAnswer" in data__sections_item__questions_item_keys:
+                                            data__sections_item__questions_item_keys.remove("correctAnswer")
+                                            data__sections_item__questions_item__correctAnswer = data__sections_item__questions_item["correctAnswer"]
+                                            if not isinstance(data__sections_item__questions_item__correctAnswer, (str)):
+                                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".sections[{data__sections_x}].questions[{data__sections_item__questions_x}].correctAnswer".format(**locals()) + " must be string")
+                                        if "explanation" in data__sections_item__questions_item_keys:
+                                            data__sections_item__questions_item_keys.remove("explanation")
+                                            data__sections_item__questions_item__explanation = data__sections_item__questions_item["explanation"]
+                                            if not isinstance(data__sections_item__questions_item__explanation, (str)):
+                                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".sections[{data__sections_x}].questions[{data__sections_item__questions_x}].explanation".format(**locals()) + " must be string")
+    return data
\ No newline at end of file
@@ -4,11 +4,11 @@ Extract images/diagrams from PDF files.
 Useful for geometry questions and data interpretation charts.
 """
 import argparse
-import json
+import os
+from multiprocessing import Pool
 from pathlib import Path
 import fitz  # PyMuPDF
-from PIL import Image
-import io
+import orjson
 from tqdm import tqdm
 
 
@@ -28,7 +28,7 @@ def extract_images_from_pdf(pdf_path: Path, output_dir: Path, min_size: int = 50
     doc = fitz.open(pdf_path)
     
     for page_num, page in enumerate(doc):
-        image_list = page.get_images()
+        image_list = page.get_images(full=True)
         
         for img_index, img in enumerate(image_list):
             xref = img[0]
@@ -38,9 +38,9 @@ def extract_images_from_pdf(pdf_path: Path, output_dir: Path, min_size: int = 50
                 image_bytes = base_image["image"]
                 image_ext = base_image["ext"]
                 
-                # Load image to check size
-                pil_image = Image.open(io.BytesIO(image_bytes))
-                width, height = pil_image.size
+                # Size comes from the image metadata, no need to decode pixels
+                width = base_image.get("width", img[2])
+                height = base_image.get("height", img[3])
                 
                 # Skip tiny images (likely icons or artifacts)
                 if width < min_size or height < min_size:
@@ -70,39 +70,72 @@ def extract_images_from_pdf(pdf_path: Path, output_dir: Path, min_size: int = 50
     return images
 
 
+def _extract_one(task: tuple) -> tuple:
+    """
+    Extract images from one PDF (runs in a pool worker).
+
+    Image files are written straight to the output directory; filenames
+    embed the PDF stem, page and index so workers never collide.
+    """
+    pdf_path, output_dir, min_size = task
+    try:
+        return pdf_path, extract_images_from_pdf(pdf_path, output_dir, min_size), None
+    except Exception as e:
+        return pdf_path, [], str(e)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Extract images from PDFs")
     parser.add_argument("input_dir", help="Directory containing PDFs")
     parser.add_argument("output_dir", help="Directory for extracted images")
     parser.add_argument("--min-size", type=int, default=50, help="Minimum image dimension")
+    parser.add_argument("--quiet", action="store_true", help="Only report problems, not per-PDF results")
     args = parser.parse_args()
     
     input_path = Path(args.input_dir)
     output_path = Path(args.output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
     
-    pdf_files = list(input_path.glob("*.pdf"))
+    pdf_files = [
+        Path(entry.path) for entry in os.scandir(input_path)
+        if entry.is_file() and entry.name.lower().endswith(".pdf")
+    ]
     print(f"Found {len(pdf_files)} PDF files")
     
-    all_images = []
+    tasks = [(pdf_file, output_path, args.min_size) for pdf_file in pdf_files]
     
-    for pdf_file in tqdm(pdf_files, desc="Extracting images"):
-        try:
-            images = extract_images_from_pdf(pdf_file, output_path, args.min_size)
-            all_images.extend(images)
-            
-            if images:
-                print(f"  ✓ {pdf_file.name}: {len(images)} images")
+    # Manifest entries are appended per PDF as results arrive, so memory stays
+    # flat and a crashed run still leaves a usable record of what was written
+    manifest_ndjson_path = output_path / "manifest.ndjson"
+    total_images = 0
+    
+    with open(manifest_ndjson_path, "wb") as manifest:
+        # Image decoding inside MuPDF is CPU-bound and PDFs are independent
+        with Pool(processes=os.cpu_count()) as pool:
+            results = pool.imap_unordered(_extract_one, tasks)
+            for pdf_file, images, error in tqdm(results, total=len(tasks), desc="Extracting images"):
+                if error:
+                    tqdm.write(f"  ✗ Error processing {pdf_file.name}: {error}")
+                    continue
+                
+                for image in images:
+                    manifest.write(orjson.dumps(image) + b"\n")
+                manifest.flush()
+                total_images += len(images)
                 
-        except Exception as e:
-            print(f"  ✗ Error processing {pdf_file.name}: {e}")
+                if images and not args.quiet:
+                    tqdm.write(f"  ✓ {pdf_file.name}: {len(images)} images")
     
-    # Save manifest
+    # Coalesce into the final manifest without loading every entry at once
     manifest_path = output_path / "manifest.json"
-    with open(manifest_path, "w", encoding="utf-8") as f:
-        json.dump({"images": all_images}, f, ensure_ascii=False, indent=2)
+    with open(manifest_ndjson_path, "rb") as src, open(manifest_path, "wb") as f:
+        f.write(b'{\n  "images": [')
+        for i, line in enumerate(src):
+            f.write((b"\n    " if i == 0 else b",\n    ") + line.rstrip(b"\n"))
+        f.write(b"\n  ]\n}\n")
+    manifest_ndjson_path.unlink()
     
-    print(f"\n✓ Extracted {len(all_images)} total images")
+    print(f"\n✓ Extracted {total_images} total images")
 
 
 if __name__ == "__main__":
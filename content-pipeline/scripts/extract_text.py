@@ -1,22 +1,37 @@
 #!/usr/bin/env python3
 """
 Extract text from PDF files using multiple strategies.
-Primary: pdfplumber (fast, good for structured text)
-Fallback: PyMuPDF (better for complex layouts)
+Primary: PyMuPDF (C engine, fast, good for complex layouts)
+Tables: pdfplumber (used for sparse pages that contain tables)
 Handles Hebrew RTL text correctly.
 """
 import argparse
-import json
 import os
+from contextlib import nullcontext
+from functools import partial
+from multiprocessing import Pool, current_process
 from pathlib import Path
 from typing import Optional
 import pdfplumber
 import fitz  # PyMuPDF
+import orjson
 from tqdm import tqdm
 
 
+# Pages with less text than this are candidates for pdfplumber table extraction
+SPARSE_PAGE_CHARS = 100
+
+# Page-count tiers. Up to PARALLEL_PAGE_THRESHOLD pages a PDF is extracted
+# sequentially in-process: forking a pool and re-opening the file per worker
+# costs more than it saves, and PyMuPDF can't be used from threads. Larger
+# PDFs are split across processes, giving each at least MIN_PAGES_PER_SEGMENT
+# pages so mid-sized documents don't start a worker per core.
+PARALLEL_PAGE_THRESHOLD = 200
+MIN_PAGES_PER_SEGMENT = 50
+
+
 def extract_with_pdfplumber(pdf_path: Path) -> dict:
-    """Extract text using pdfplumber (primary method)."""
+    """Extract text and tables using pdfplumber."""
     result = {
         "source": pdf_path.name,
         "method": "pdfplumber",
@@ -39,37 +54,138 @@ def extract_with_pdfplumber(pdf_path: Path) -> dict:
     return result
 
 
+def _pymupdf_page(page, index: int) -> dict:
+    """Extract text and text block positions from one PyMuPDF page."""
+    # Both outputs come from one text parse of the page
+    textpage = page.get_textpage()
+    text = page.get_text("text", textpage=textpage)
+    
+    # Extract text blocks with position info (useful for RTL ordering)
+    # Tuples: (x0, y0, x1, y1, text, block_no, block_type)
+    blocks = page.get_text("blocks", textpage=textpage)
+    
+    return {
+        "number": index + 1,
+        "text": text,
+        "blocks": [
+            {"bbox": b[:4], "text": b[4]}
+            for b in blocks if b[6] == 0
+        ],
+        "width": page.rect.width,
+        "height": page.rect.height
+    }
+
+
+def _pymupdf_range(doc, start: int, end: int, check_tables: bool = False) -> tuple:
+    """
+    Extract pages [start, end) of an open PyMuPDF document.
+    
+    Returns (pages, table_pages) where table_pages lists the numbers of
+    sparse pages that contain tables (only when check_tables is set).
+    """
+    pages = []
+    table_pages = []
+    
+    for i in range(start, end):
+        page = doc[i]
+        page_data = _pymupdf_page(page, i)
+        pages.append(page_data)
+        
+        if check_tables and len(page_data["text"].strip()) < SPARSE_PAGE_CHARS and page.find_tables().tables:
+            table_pages.append(page_data["number"])
+    
+    return pages, table_pages
+
+
+def _extract_range(task: tuple) -> tuple:
+    """
+    Extract one page segment in a pool worker.
+    
+    PyMuPDF documents can't be pickled, so each worker re-opens the file
+    from its path.
+    """
+    pdf_path, start, end, check_tables = task
+    doc = fitz.open(pdf_path)
+    try:
+        return _pymupdf_range(doc, start, end, check_tables)
+    finally:
+        doc.close()
+
+
+def extract_with_pymupdf_parallel(pdf_path: Path, page_count: int, nproc: Optional[int] = None,
+                                  check_tables: bool = False) -> tuple:
+    """
+    Extract a large PDF by splitting its pages into contiguous segments,
+    one per process. Returns (pages, table_pages) like _pymupdf_range.
+    """
+    nproc = min(nproc or os.cpu_count() or 1, max(1, page_count // MIN_PAGES_PER_SEGMENT))
+    segment_size = -(-page_count // nproc)  # ceil division
+    tasks = [
+        (pdf_path, start, min(start + segment_size, page_count), check_tables)
+        for start in range(0, page_count, segment_size)
+    ]
+    
+    with Pool(processes=len(tasks)) as pool:
+        segments = pool.map(_extract_range, tasks)
+    
+    pages = []
+    table_pages = []
+    for segment_pages, segment_table_pages in segments:
+        pages.extend(segment_pages)
+        table_pages.extend(segment_table_pages)
+    
+    return pages, table_pages
+
+
+def _extract_pymupdf_pages(pdf_path: Path, check_tables: bool = False) -> tuple:
+    """Extract all pages with PyMuPDF, in parallel segments for large PDFs."""
+    doc = fitz.open(pdf_path)
+    try:
+        page_count = doc.page_count
+        
+        # Pool workers are daemonic and can't start their own pools; batch
+        # runs already spread whole PDFs across processes
+        if page_count > PARALLEL_PAGE_THRESHOLD and not current_process().daemon:
+            return extract_with_pymupdf_parallel(pdf_path, page_count, check_tables=check_tables)
+        
+        return _pymupdf_range(doc, 0, page_count, check_tables)
+    finally:
+        doc.close()
+
+
 def extract_with_pymupdf(pdf_path: Path) -> dict:
-    """Extract text using PyMuPDF (fallback for complex layouts)."""
+    """Extract text using PyMuPDF (primary method)."""
+    pages, _ = _extract_pymupdf_pages(pdf_path)
+    
+    return {
+        "source": pdf_path.name,
+        "method": "pymupdf",
+        "pages": pages
+    }
+
+
+def extract_auto(pdf_path: Path) -> dict:
+    """
+    Extract with PyMuPDF, using pdfplumber only for sparse pages where
+    PyMuPDF detects tables.
+    """
+    pages, table_pages = _extract_pymupdf_pages(pdf_path, check_tables=True)
+    
     result = {
         "source": pdf_path.name,
         "method": "pymupdf",
-        "pages": []
+        "pages": pages
     }
     
-    doc = fitz.open(pdf_path)
-    for i, page in enumerate(doc):
-        text = page.get_text("text")
-        
-        # Extract text blocks with position info (useful for RTL ordering)
-        blocks = page.get_text("dict")["blocks"]
-        
-        result["pages"].append({
-            "number": i + 1,
-            "text": text,
-            "blocks": [
-                {
-                    "bbox": b.get("bbox"),
-                    "text": b.get("lines", [{}])[0].get("spans", [{}])[0].get("text", "") 
-                    if b.get("type") == 0 else None
-                }
-                for b in blocks if b.get("type") == 0
-            ],
-            "width": page.rect.width,
-            "height": page.rect.height
-        })
-    
-    doc.close()
+    if table_pages:
+        result["method"] = "pymupdf+pdfplumber"
+        with pdfplumber.open(pdf_path) as pdf:
+            for number in table_pages:
+                page = pdf.pages[number - 1]
+                page_data = pages[number - 1]
+                page_data["text"] = page.extract_text() or page_data["text"]
+                page_data["tables"] = page.extract_tables() or []
+    
     return result
 
 
@@ -89,16 +205,40 @@ def extract_pdf_text(pdf_path: Path, method: str = "auto") -> dict:
     elif method == "pymupdf":
         return extract_with_pymupdf(pdf_path)
     else:  # auto
-        # Try pdfplumber first, fall back to pymupdf if result is sparse
-        result = extract_with_pdfplumber(pdf_path)
-        
-        # Check if extraction was successful (has meaningful text)
-        total_text = "".join(p["text"] for p in result["pages"])
-        if len(total_text.strip()) < 100:  # Very little text extracted
-            print(f"  ⚠ pdfplumber sparse result, trying PyMuPDF...")
-            result = extract_with_pymupdf(pdf_path)
+        return extract_auto(pdf_path)
+
+
+def _prefetch(pdf_path: Path) -> None:
+    """
+    Hint the kernel to start reading the whole file into the page cache,
+    so the parser's reads hit memory. No-op where posix_fadvise is missing.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    
+    fd = os.open(pdf_path, os.O_RDONLY)
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    finally:
+        os.close(fd)
+
+
+def _worker(pdf_file: Path, output_path: Path, method: str) -> tuple:
+    """
+    Extract a single PDF and write its JSON (runs in a pool worker).
+
+    Only the output path is sent back to the parent, so large result
+    dicts never cross the process pipe.
+    """
+    try:
+        _prefetch(pdf_file)
+        result = extract_pdf_text(pdf_file, method)
+        output_file = output_path / f"{pdf_file.stem}.json"
+        output_file.write_bytes(orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
         
-        return result
+        return pdf_file, output_file, None
+    except Exception as e:
+        return pdf_file, None, str(e)
 
 
 def main():
@@ -113,19 +253,25 @@ def main():
     output_path = Path(args.output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
     
-    pdf_files = list(input_path.glob("*.pdf"))
+    pdf_files = [
+        Path(entry.path) for entry in os.scandir(input_path)
+        if entry.is_file() and entry.name.lower().endswith(".pdf")
+    ]
     print(f"Found {len(pdf_files)} PDF files")
     
-    for pdf_file in tqdm(pdf_files, desc="Extracting"):
-        try:
-            result = extract_pdf_text(pdf_file, args.method)
-            output_file = output_path / f"{pdf_file.stem}.json"
-            
-            with open(output_file, "w", encoding="utf-8") as f:
-                json.dump(result, f, ensure_ascii=False, indent=2)
-            
-        except Exception as e:
-            print(f"  ✗ Error processing {pdf_file.name}: {e}")
+    # PDFs are independent and parsing is CPU-bound, so fan out across
+    # processes (PyMuPDF is not thread-safe). A single PDF runs in-process
+    # so a large one can split its pages across processes instead.
+    worker = partial(_worker, output_path=output_path, method=args.method)
+    with Pool(processes=os.cpu_count()) if len(pdf_files) > 1 else nullcontext() as pool:
+        if pool:
+            results = pool.imap_unordered(worker, pdf_files, chunksize=1)
+        else:
+            results = map(worker, pdf_files)
+        
+        for pdf_file, output_file, error in tqdm(results, total=len(pdf_files), desc="Extracting"):
+            if error:
+                tqdm.write(f"  ✗ Error processing {pdf_file.name}: {error}")
 
 
 if __name__ == "__main__":
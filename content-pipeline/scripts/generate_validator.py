@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+Generate precompiled validator modules for the exam schema.
+Run after editing EXAM_SCHEMA; validate.py falls back to compiling the
+schema at runtime when the generated module is missing or out of date.
+"""
+from pathlib import Path
+import fastjsonschema
+from validate import EXAM_SCHEMA, schema_hash
+
+
+OUTPUT_FILE = Path(__file__).parent / "_exam_validator_generated.py"
+
+
+def main():
+    # Detailed messages come from jsonschema on failure, so the generated
+    # code only needs to raise
+    code = fastjsonschema.compile_to_code(EXAM_SCHEMA, detailed_exceptions=False)
+    
+    header = (
+        "# Generated by generate_validator.py from EXAM_SCHEMA - do not edit.\n"
+        f'SCHEMA_HASH = "{schema_hash(EXAM_SCHEMA)}"\n\n'
+    )
+    OUTPUT_FILE.write_text(header + code, encoding="utf-8")
+    
+    print(f"✓ Wrote {OUTPUT_FILE.name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,11 +4,13 @@ Parse extracted text into structured exam JSON.
 Detects question patterns, section boundaries, and question types.
 """
 import argparse
-import json
+import os
 import re
 import uuid
 from pathlib import Path
 from typing import Optional
+import ahocorasick
+import orjson
 from tqdm import tqdm
 
 
@@ -40,35 +42,91 @@ QUESTION_TYPE_PATTERNS = {
     "reading-comprehension-english": [r"passage", r"according to", r"the author"],
 }
 
+# Question types that can appear in each section, in detection priority order
+SECTION_TO_TYPES = {
+    "quantitative": ["algebra", "geometry", "data-interpretation", "word-problem", "sequences"],
+    "verbal": ["analogy", "sentence-completion", "reading-comprehension-hebrew", "logic"],
+    "english": ["sentence-completion-english", "restatement", "reading-comprehension-english"],
+}
+
 # Hebrew option labels
 HEBREW_OPTIONS = ["א", "ב", "ג", "ד"]
 ENGLISH_OPTIONS = ["A", "B", "C", "D"]
 
+# Question start anchor: number followed by period or parenthesis at line start
+QUESTION_ANCHOR_PATTERN = re.compile(r'^\s*(\d{1,2})[\.\)]\s*', re.MULTILINE)
+YEAR_PATTERN = re.compile(r"20\d{2}")
+REGEX_SYNTAX_PATTERN = re.compile(r"[.^$*+?{}\[\]\\|()]")
+
+
+def _is_literal(pattern: str) -> bool:
+    """True if a pattern uses no regex syntax and can be matched as plain text."""
+    return not REGEX_SYNTAX_PATTERN.search(pattern)
+
+
+def _build_keyword_automaton(patterns_by_key: dict) -> ahocorasick.Automaton:
+    """
+    Build an Aho-Corasick automaton over the literal patterns; each
+    lowercased keyword maps to the list of keys it indicates.
+    """
+    automaton = ahocorasick.Automaton()
+    for key, patterns in patterns_by_key.items():
+        for pattern in patterns:
+            if _is_literal(pattern):
+                keyword = pattern.lower()
+                automaton.add_word(keyword, automaton.get(keyword, []) + [key])
+    automaton.make_automaton()
+    return automaton
+
+
+# Literal keywords are found in one Aho-Corasick pass over the text; only
+# patterns that need regex syntax are searched with re
+SECTION_AUTOMATON = _build_keyword_automaton(SECTION_PATTERNS)
+QUESTION_TYPE_AUTOMATON = _build_keyword_automaton(QUESTION_TYPE_PATTERNS)
+QUESTION_TYPE_REGEXES = {
+    qtype: re.compile("|".join(regex_patterns), re.IGNORECASE)
+    for qtype, patterns in QUESTION_TYPE_PATTERNS.items()
+    if (regex_patterns := [p for p in patterns if not _is_literal(p)])
+}
+
+
+def _build_option_regex(label: str) -> re.Pattern:
+    """
+    Match an option label - א. / א) / (א) - preceded by punctuation,
+    whitespace or start of text.
+    """
+    return re.compile(rf'(?:(?<=[\.\)\(\s])|^)\(?{re.escape(label)}[\.\)\s]')
+
+
+HEBREW_OPTION_REGEX = [_build_option_regex(label) for label in HEBREW_OPTIONS]
+ENGLISH_OPTION_REGEX = [_build_option_regex(label) for label in ENGLISH_OPTIONS]
+
 
 def detect_section_type(text: str) -> Optional[str]:
     """Detect section type from text content."""
-    text_lower = text.lower()
-    for section_type, patterns in SECTION_PATTERNS.items():
-        for pattern in patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                return section_type
+    found = set()
+    for _, section_types in SECTION_AUTOMATON.iter(text.lower()):
+        found.update(section_types)
+    
+    for section_type in SECTION_PATTERNS:
+        if section_type in found:
+            return section_type
     return None
 
 
 def detect_question_type(stem: str, section_type: str) -> str:
     """Detect question type based on content patterns."""
-    for qtype, patterns in QUESTION_TYPE_PATTERNS.items():
-        # Only match types relevant to section
-        if section_type == "quantitative" and qtype not in ["algebra", "geometry", "data-interpretation", "word-problem", "sequences"]:
-            continue
-        if section_type == "verbal" and qtype not in ["analogy", "sentence-completion", "reading-comprehension-hebrew", "logic"]:
-            continue
-        if section_type == "english" and qtype not in ["sentence-completion-english", "restatement", "reading-comprehension-english"]:
-            continue
-            
-        for pattern in patterns:
-            if re.search(pattern, stem, re.IGNORECASE):
-                return qtype
+    found = set()
+    for _, qtypes in QUESTION_TYPE_AUTOMATON.iter(stem.lower()):
+        found.update(qtypes)
+    
+    # Only match types relevant to section, in priority order
+    for qtype in SECTION_TO_TYPES.get(section_type, QUESTION_TYPE_PATTERNS):
+        if qtype in found:
+            return qtype
+        regex = QUESTION_TYPE_REGEXES.get(qtype)
+        if regex and regex.search(stem):
+            return qtype
     
     # Default by section
     defaults = {
@@ -89,37 +147,42 @@ def parse_questions_from_text(text: str, section_type: str, section_id: str) ->
     """
     questions = []
     
-    # Pattern for question start: number followed by period or period followed by number
-    question_pattern = r'(?:^|\n)\s*(\d{1,2})[\.\)]\s*(.+?)(?=(?:\n\s*\d{1,2}[\.\)])|$)'
+    # Find all potential question starts; each body runs to the next anchor
+    anchors = list(QUESTION_ANCHOR_PATTERN.finditer(text))
     
-    # Find all potential questions
-    matches = re.findall(question_pattern, text, re.DOTALL)
+    if section_type == "english":
+        option_labels, option_regexes = ENGLISH_OPTIONS, ENGLISH_OPTION_REGEX
+    else:
+        option_labels, option_regexes = HEBREW_OPTIONS, HEBREW_OPTION_REGEX
     
-    for match in matches:
-        q_num = int(match[0])
-        q_content = match[1].strip()
+    for i, anchor in enumerate(anchors):
+        q_num = int(anchor.group(1))
+        end = anchors[i + 1].start() if i + 1 < len(anchors) else len(text)
+        q_content = text[anchor.end():end].strip()
         
-        # Try to extract options
-        options = []
-        option_labels = HEBREW_OPTIONS if section_type != "english" else ENGLISH_OPTIONS
+        # Find each label's first occurrence after the previous label; one
+        # search per label, each resuming where the last one matched
+        label_positions = []
+        pos = 0
+        for label, option_regex in zip(option_labels, option_regexes):
+            label_match = option_regex.search(q_content, pos)
+            if label_match:
+                label_positions.append((label_match.start(), label_match.end(), label))
+                pos = label_match.end()
         
-        for i, label in enumerate(option_labels):
-            # Look for option pattern: א. or א) or (א)
-            option_pattern = rf'[\.|\)|\(]?\s*{label}\s*[\.|\)|\(]?\s*(.+?)(?=[\.|\)|\(]?\s*[{"|".join(option_labels[i+1:])}]|$)' if i < len(option_labels) - 1 else rf'[\.|\)|\(]?\s*{label}\s*[\.|\)|\(]?\s*(.+?)$'
-            option_match = re.search(option_pattern, q_content, re.DOTALL)
-            if option_match:
-                options.append({
-                    "label": label,
-                    "text": option_match.group(1).strip()
-                })
+        # Option text runs from its label to the next label
+        options = []
+        for i, (_, text_start, label) in enumerate(label_positions):
+            text_end = label_positions[i + 1][0] if i + 1 < len(label_positions) else len(q_content)
+            options.append({
+                "label": label,
+                "text": q_content[text_start:text_end].strip()
+            })
         
         # Extract stem (text before first option)
         stem = q_content
-        if options:
-            first_option_pattern = rf'[\.|\)|\(]?\s*{option_labels[0]}\s*[\.|\)]'
-            stem_match = re.split(first_option_pattern, q_content)
-            if stem_match:
-                stem = stem_match[0].strip()
+        if label_positions:
+            stem = q_content[:label_positions[0][0]].strip()
         
         if stem and len(options) >= 2:  # Valid question needs stem and at least 2 options
             questions.append({
@@ -137,8 +200,7 @@ def parse_questions_from_text(text: str, section_type: str, section_id: str) ->
 
 def parse_exam_file(raw_json_path: Path, exam_id: str) -> dict:
     """Parse a single exam's raw extraction into structured format."""
-    with open(raw_json_path, "r", encoding="utf-8") as f:
-        raw_data = json.load(f)
+    raw_data = orjson.loads(raw_json_path.read_bytes())
     
     # Combine all page text
     full_text = "\n".join(page["text"] for page in raw_data.get("pages", []))
@@ -166,7 +228,7 @@ def parse_exam_file(raw_json_path: Path, exam_id: str) -> dict:
             season = eng
             break
     
-    year_match = re.search(r"20\d{2}", filename)
+    year_match = YEAR_PATTERN.search(filename)
     if year_match:
         year = int(year_match.group())
     
@@ -212,7 +274,10 @@ def main():
     output_path = Path(args.output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
     
-    json_files = list(input_path.glob("*.json"))
+    json_files = [
+        Path(entry.path) for entry in os.scandir(input_path)
+        if entry.is_file() and entry.name.endswith(".json")
+    ]
     print(f"Found {len(json_files)} raw JSON files")
     
     exams = []
@@ -224,8 +289,7 @@ def main():
             
             # Save individual exam
             output_file = output_path / f"{exam_id}.json"
-            with open(output_file, "w", encoding="utf-8") as f:
-                json.dump(exam, f, ensure_ascii=False, indent=2)
+            output_file.write_bytes(orjson.dumps(exam, option=orjson.OPT_INDENT_2))
             
             exams.append({
                 "id": exam["id"],
@@ -236,12 +300,11 @@ def main():
             })
             
         except Exception as e:
-            print(f"  ✗ Error parsing {json_file.name}: {e}")
+            tqdm.write(f"  ✗ Error parsing {json_file.name}: {e}")
     
     # Create index file
     index_file = output_path / "index.json"
-    with open(index_file, "w", encoding="utf-8") as f:
-        json.dump({"exams": exams}, f, ensure_ascii=False, indent=2)
+    index_file.write_bytes(orjson.dumps({"exams": exams}, option=orjson.OPT_INDENT_2))
     
     print(f"\n✓ Created {len(exams)} exam files + index.json")
 
@@ -4,13 +4,30 @@ Parse solution PDFs and merge answers/explanations into exam questions.
 Matches solutions to questions by exam season, section type, and question number.
 """
 import argparse
-import json
+import os
 import re
 from pathlib import Path
 from typing import Optional
+import orjson
 from tqdm import tqdm
 
 
+# Common patterns for solutions:
+# 1. "שאלה 7: ג" or "Question 7: C"
+# 2. "7. התשובה הנכונה: ג"
+# 3. "7) ג - הסבר..."
+HEBREW_ANSWER_RE = re.compile(
+    r'(?:שאלה\s*)?(\d{1,2})[\.\)\:]?\s*(?:התשובה(?:\s+הנכונה)?[\:\s]*)?([אבגד])\b\s*[-–]?\s*(.+?)(?=(?:שאלה\s*)?\d{1,2}[\.\)\:]|$)',
+    re.DOTALL | re.IGNORECASE
+)
+ENGLISH_ANSWER_RE = re.compile(
+    r'(?:Question\s*)?(\d{1,2})[\.\)\:]?\s*(?:(?:The\s+)?(?:correct\s+)?answer[\:\s]*)?([ABCD])\b\s*[-–]?\s*(.+?)(?=(?:Question\s*)?\d{1,2}[\.\)\:]|$)',
+    re.DOTALL | re.IGNORECASE
+)
+WHITESPACE_RE = re.compile(r'\s+')
+YEAR_RE = re.compile(r"20\d{2}")
+EXAM_FILENAME_RE = re.compile(r"(spring|summer|fall|winter).*?(20\d{2})")
+
 def extract_solutions_from_text(text: str) -> dict:
     """
     Extract correct answers and explanations from solution text.
@@ -19,22 +36,11 @@ def extract_solutions_from_text(text: str) -> dict:
     """
     solutions = {}
     
-    # Common patterns for solutions:
-    # 1. "שאלה 7: ג" or "Question 7: C"
-    # 2. "7. התשובה הנכונה: ג"
-    # 3. "7) ג - הסבר..."
-    
-    # Hebrew answer pattern
-    hebrew_pattern = r'(?:שאלה\s*)?(\d{1,2})[\.\)\:]?\s*(?:התשובה(?:\s+הנכונה)?[\:\s]*)?([אבגד])\b\s*[-–]?\s*(.+?)(?=(?:שאלה\s*)?\d{1,2}[\.\)\:]|$)'
-    
-    # English answer pattern  
-    english_pattern = r'(?:Question\s*)?(\d{1,2})[\.\)\:]?\s*(?:(?:The\s+)?(?:correct\s+)?answer[\:\s]*)?([ABCD])\b\s*[-–]?\s*(.+?)(?=(?:Question\s*)?\d{1,2}[\.\)\:]|$)'
-    
     # Try Hebrew first
-    matches = re.findall(hebrew_pattern, text, re.DOTALL | re.IGNORECASE)
+    matches = HEBREW_ANSWER_RE.findall(text)
     
     if not matches:
-        matches = re.findall(english_pattern, text, re.DOTALL | re.IGNORECASE)
+        matches = ENGLISH_ANSWER_RE.findall(text)
     
     for match in matches:
         q_num = int(match[0])
@@ -42,7 +48,7 @@ def extract_solutions_from_text(text: str) -> dict:
         explanation = match[2].strip() if len(match) > 2 else ""
         
         # Clean up explanation
-        explanation = re.sub(r'\s+', ' ', explanation).strip()
+        explanation = WHITESPACE_RE.sub(' ', explanation).strip()
         
         solutions[q_num] = {
             "answer": answer,
@@ -82,7 +88,7 @@ def match_solution_to_exam(solution_filename: str) -> dict:
             break
     
     # Year detection
-    year_match = re.search(r"20\d{2}", filename)
+    year_match = YEAR_RE.search(filename)
     if year_match:
         result["year"] = int(year_match.group())
     
@@ -105,14 +111,47 @@ def match_solution_to_exam(solution_filename: str) -> dict:
     return result
 
 
-def merge_solutions_into_exam(exam_path: Path, solutions: dict, section_type: str, order: int) -> bool:
+def build_exam_index(exams_path: Path) -> dict:
+    """
+    Map (season, year) to the exam files its solutions should merge into.
+    
+    An exact "{season}_{year}.json" file wins; otherwise every exam file
+    whose name mentions the season followed by the year is included.
+    """
+    candidates = {}
+    for entry in os.scandir(exams_path):
+        if not (entry.is_file() and entry.name.endswith(".json")):
+            continue
+        
+        exam_file = Path(entry.path)
+        match = EXAM_FILENAME_RE.search(exam_file.stem)
+        if match:
+            key = (match.group(1), int(match.group(2)))
+            candidates.setdefault(key, []).append(exam_file)
+    
+    index = {}
+    for (season, year), exam_files in candidates.items():
+        direct = [f for f in exam_files if f.stem == f"{season}_{year}"]
+        index[(season, year)] = direct or exam_files
+    
+    return index
+
+
+def load_exam(exam_path: Path) -> dict:
+    """Load an exam JSON file."""
+    return orjson.loads(exam_path.read_bytes())
+
+
+def save_exam(exam_path: Path, exam: dict) -> None:
+    """Write an exam JSON file."""
+    exam_path.write_bytes(orjson.dumps(exam, option=orjson.OPT_INDENT_2))
+
+
+def merge_solutions_into_exam(exam: dict, solutions: dict, section_type: str, order: int) -> bool:
     """
-    Merge solutions into an exam JSON file.
+    Merge solutions into an in-memory exam dict.
     Returns True if any changes were made.
     """
-    with open(exam_path, "r", encoding="utf-8") as f:
-        exam = json.load(f)
-    
     changes_made = False
     
     for section in exam.get("sections", []):
@@ -126,10 +165,6 @@ def merge_solutions_into_exam(exam_path: Path, solutions: dict, section_type: st
                         question["explanation"] = sol["explanation"]
                     changes_made = True
     
-    if changes_made:
-        with open(exam_path, "w", encoding="utf-8") as f:
-            json.dump(exam, f, ensure_ascii=False, indent=2)
-    
     return changes_made
 
 
@@ -137,55 +172,69 @@ def main():
     parser = argparse.ArgumentParser(description="Parse solutions and merge into exams")
     parser.add_argument("solutions_dir", help="Directory containing solution JSON extractions")
     parser.add_argument("exams_dir", help="Directory containing parsed exam JSON files")
+    parser.add_argument("--quiet", action="store_true", help="Only report problems, not successful merges")
     args = parser.parse_args()
     
     solutions_path = Path(args.solutions_dir)
     exams_path = Path(args.exams_dir)
     
-    solution_files = list(solutions_path.glob("*.json"))
+    solution_files = [
+        Path(entry.path) for entry in os.scandir(solutions_path)
+        if entry.is_file() and entry.name.endswith(".json")
+    ]
     print(f"Found {len(solution_files)} solution files")
     
+    exam_index = build_exam_index(exams_path)
+    
+    # Several solution files (sections/orders) target the same exam, so each
+    # exam is parsed once, updated in memory and written back once at the end
+    exam_cache = {}
+    dirty = set()
+    
     for sol_file in tqdm(solution_files, desc="Merging solutions"):
         try:
             # Load solution text
-            with open(sol_file, "r", encoding="utf-8") as f:
-                raw_data = json.load(f)
+            raw_data = orjson.loads(sol_file.read_bytes())
             
             full_text = "\n".join(page.get("text", "") for page in raw_data.get("pages", []))
             solutions = extract_solutions_from_text(full_text)
             
             if not solutions:
-                print(f"  ⚠ No solutions found in {sol_file.name}")
+                tqdm.write(f"  ⚠ No solutions found in {sol_file.name}")
                 continue
             
             # Match to exam
             match_info = match_solution_to_exam(sol_file.stem)
             
             if not all([match_info["season"], match_info["year"], match_info["section_type"]]):
-                print(f"  ⚠ Could not match {sol_file.name} to exam")
+                tqdm.write(f"  ⚠ Could not match {sol_file.name} to exam")
                 continue
             
             # Find matching exam file
-            exam_pattern = f"*{match_info['season']}*{match_info['year']}*.json"
-            matching_exams = list(exams_path.glob(exam_pattern))
-            
-            # Also try by constructing expected ID
-            expected_id = f"{match_info['season']}_{match_info['year']}"
-            direct_match = exams_path / f"{expected_id}.json"
-            if direct_match.exists():
-                matching_exams = [direct_match]
+            matching_exams = exam_index.get((match_info["season"], match_info["year"]), [])
             
             for exam_file in matching_exams:
+                if exam_file not in exam_cache:
+                    exam_cache[exam_file] = load_exam(exam_file)
+                
                 if merge_solutions_into_exam(
-                    exam_file, 
+                    exam_cache[exam_file], 
                     solutions, 
                     match_info["section_type"], 
                     match_info["order"]
                 ):
-                    print(f"  ✓ Merged {len(solutions)} solutions into {exam_file.name}")
+                    dirty.add(exam_file)
+                    if not args.quiet:
+                        tqdm.write(f"  ✓ Merged {len(solutions)} solutions into {exam_file.name}")
                     
         except Exception as e:
-            print(f"  ✗ Error processing {sol_file.name}: {e}")
+            tqdm.write(f"  ✗ Error processing {sol_file.name}: {e}")
+    
+    for exam_file in dirty:
+        try:
+            save_exam(exam_file, exam_cache[exam_file])
+        except Exception as e:
+            print(f"  ✗ Error writing {exam_file.name}: {e}")
 
 
 if __name__ == "__main__":
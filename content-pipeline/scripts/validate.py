@@ -4,65 +4,298 @@ Validate parsed exam JSON files against schema.
 Reports missing data and quality issues.
 """
 import argparse
-import json
+import hashlib
+import importlib
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from jsonschema import validate, ValidationError
+import fastjsonschema
+import ijson
+import orjson
+from jsonschema import Draft7Validator, ValidationError, validators
 
 
-EXAM_SCHEMA = {
-    "$schema": "http://json-schema.org/draft-07/schema#",
+SECTION_SCHEMA = {
     "type": "object",
-    "required": ["id", "season", "year", "sections"],
+    "required": ["id", "examId", "type", "order", "questions"],
     "properties": {
         "id": {"type": "string"},
-        "season": {"enum": ["spring", "summer", "fall", "winter"]},
-        "year": {"type": "integer", "minimum": 2000, "maximum": 2100},
-        "hebrewName": {"type": "string"},
-        "sections": {
+        "examId": {"type": "string"},
+        "type": {"enum": ["quantitative", "verbal", "english"]},
+        "order": {"enum": [1, 2]},
+        "timeLimitMinutes": {"type": "integer"},
+        "questions": {
             "type": "array",
             "items": {
                 "type": "object",
-                "required": ["id", "examId", "type", "order", "questions"],
+                "required": ["id", "sectionId", "number", "stem", "options"],
                 "properties": {
                     "id": {"type": "string"},
-                    "examId": {"type": "string"},
-                    "type": {"enum": ["quantitative", "verbal", "english"]},
-                    "order": {"enum": [1, 2]},
-                    "timeLimitMinutes": {"type": "integer"},
-                    "questions": {
+                    "sectionId": {"type": "string"},
+                    "number": {"type": "integer", "minimum": 1},
+                    "type": {"type": "string"},
+                    "stem": {"type": "string", "minLength": 1},
+                    "options": {
                         "type": "array",
+                        "minItems": 2,
                         "items": {
                             "type": "object",
-                            "required": ["id", "sectionId", "number", "stem", "options"],
+                            "required": ["label", "text"],
                             "properties": {
-                                "id": {"type": "string"},
-                                "sectionId": {"type": "string"},
-                                "number": {"type": "integer", "minimum": 1},
-                                "type": {"type": "string"},
-                                "stem": {"type": "string", "minLength": 1},
-                                "options": {
-                                    "type": "array",
-                                    "minItems": 2,
-                                    "items": {
-                                        "type": "object",
-                                        "required": ["label", "text"],
-                                        "properties": {
-                                            "label": {"type": "string"},
-                                            "text": {"type": "string"}
-                                        }
-                                    }
-                                },
-                                "correctAnswer": {"type": "string"},
-                                "explanation": {"type": "string"}
+                                "label": {"type": "string"},
+                                "text": {"type": "string"}
                             }
                         }
-                    }
+                    },
+                    "correctAnswer": {"type": "string"},
+                    "explanation": {"type": "string"}
                 }
             }
         }
     }
 }
 
+EXAM_SCHEMA = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "type": "object",
+    "required": ["id", "season", "year", "sections"],
+    "properties": {
+        "id": {"type": "string"},
+        "season": {"enum": ["spring", "summer", "fall", "winter"]},
+        "year": {"type": "integer", "minimum": 2000, "maximum": 2100},
+        "hebrewName": {"type": "string"},
+        "sections": {
+            "type": "array",
+            "items": SECTION_SCHEMA
+        }
+    }
+}
+
+
+_SCHEMAS = {
+    "exam": EXAM_SCHEMA,
+    "section": SECTION_SCHEMA,
+}
+
+# Checked before the full schema walk so obviously malformed files fail fast
+REQUIRED_EXAM_KEYS = frozenset(EXAM_SCHEMA["required"])
+
+# Files larger than this are validated section by section while streaming,
+# so memory is bounded by the largest section instead of the whole file
+STREAMING_THRESHOLD_BYTES = 32 * 1024 * 1024
+
+
+def _collect_enum_sets(schema, enum_sets: dict) -> dict:
+    """Map id() of every enum list in a schema to a frozenset of its values."""
+    if isinstance(schema, dict):
+        enums = schema.get("enum")
+        # Sets conflate True with 1, so enums holding bools keep the list check
+        if isinstance(enums, list) and not any(isinstance(e, bool) for e in enums):
+            enum_sets[id(enums)] = frozenset(enums)
+        for value in schema.values():
+            _collect_enum_sets(value, enum_sets)
+    elif isinstance(schema, list):
+        for item in schema:
+            _collect_enum_sets(item, enum_sets)
+    return enum_sets
+
+
+# Enum lists are static, so their lookup sets are built once per process
+_ENUM_SETS = _collect_enum_sets(EXAM_SCHEMA, {})
+
+
+def _enum(validator, enums, instance, schema):
+    """enum keyword checked with a set lookup, falling back to the draft-07 check."""
+    enum_set = _ENUM_SETS.get(id(enums))
+    if enum_set is None or isinstance(instance, (bool, dict, list)):
+        yield from Draft7Validator.VALIDATORS["enum"](validator, enums, instance, schema)
+    elif instance not in enum_set:
+        yield ValidationError(f"{instance!r} is not one of {enums!r}")
+
+
+ExamValidator = validators.extend(Draft7Validator, {"enum": _enum})
+
+# Warnings are stored as (kind, value) and only formatted when displayed
+WARNING_MESSAGES = {
+    "missing_answer": "Q{}: Missing correct answer",
+    "empty_options": "{} empty option texts found",
+}
+
+# Ahead-of-time compiled validator modules written by generate_validator.py
+_GENERATED_MODULES = {
+    "exam": "_exam_validator_generated",
+}
+
+
+def schema_hash(schema: dict) -> str:
+    """Stable fingerprint of a schema, used to detect stale generated validators."""
+    return hashlib.sha256(orjson.dumps(schema, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+
+@lru_cache(maxsize=None)
+def _schema_key(schema_id: str) -> str:
+    """Fingerprint of a registered schema, computed once per process."""
+    return schema_hash(_SCHEMAS[schema_id])
+
+
+# Built validators keyed by (kind, schema fingerprint), so schemas with the
+# same content share one validator whatever id they are registered under
+_VALIDATOR_CACHE = {}
+
+
+def _cached_validator(kind: str, schema_id: str, build):
+    """Return the cached validator of a kind for a schema, building it on first use."""
+    key = (kind, _schema_key(schema_id))
+    validator = _VALIDATOR_CACHE.get(key)
+    if validator is None:
+        validator = _VALIDATOR_CACHE[key] = build(schema_id)
+    return validator
+
+
+def _load_generated_validator(schema_id: str):
+    """Return the pregenerated validate() for a schema, or None if missing or stale."""
+    module_name = _GENERATED_MODULES.get(schema_id)
+    if not module_name:
+        return None
+    
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError:
+        return None
+    
+    if module.SCHEMA_HASH != _schema_key(schema_id):
+        return None
+    return module.validate
+
+
+def _build_compiled_validator(schema_id: str):
+    """
+    Code-generated pass/fail validator for a schema. Uses the module from
+    generate_validator.py when it is current, otherwise compiles the schema.
+    """
+    schema = _SCHEMAS[schema_id]
+    
+    # The schemas are constant literals, so checking them against the
+    # draft-07 meta-schema is opt-in (e.g. when editing a schema)
+    if os.getenv("VALIDATE_META"):
+        Draft7Validator.check_schema(schema)
+    
+    return _load_generated_validator(schema_id) or fastjsonschema.compile(schema)
+
+
+def _compiled_validator_for(schema_id: str):
+    """Pass/fail validator for a schema, built once per process."""
+    return _cached_validator("compiled", schema_id, _build_compiled_validator)
+
+
+def _validator_for(schema_id: str) -> ExamValidator:
+    """Full validator for a schema, only needed to report every error of a failing file."""
+    return _cached_validator("full", schema_id, lambda schema_id: ExamValidator(_SCHEMAS[schema_id]))
+
+
+def _schema_errors(schema_id: str, instance) -> list:
+    """
+    Validate an instance against a registered schema. Cheap pass/fail
+    first; the detailed error messages are only collected on failure.
+    """
+    try:
+        _compiled_validator_for(schema_id)(instance)
+        return []
+    except fastjsonschema.JsonSchemaException as e:
+        return [error.message for error in _validator_for(schema_id).iter_errors(instance)] or [e.message]
+
+
+def _add_question_stats(questions: list, stats: dict, warnings: list) -> None:
+    """
+    Fold a batch of schema-valid questions into the running quality stats.
+    Required keys are indexed directly; correctAnswer and explanation are
+    optional and parse_exam writes "" placeholders, so they are checked
+    for truthiness rather than presence.
+    """
+    missing_answers = [
+        ("missing_answer", question["number"])
+        for question in questions if not question.get("correctAnswer")
+    ]
+    stats["totalQuestions"] += len(questions)
+    stats["withAnswers"] += len(questions) - len(missing_answers)
+    stats["withExplanations"] += sum(1 for question in questions if question.get("explanation"))
+    stats["emptyOptions"] += sum(1 for question in questions for opt in question["options"] if not opt["text"])
+    
+    warnings.extend(missing_answers)
+
+
+def _check_exam(file_path: Path, stats: dict, warnings: list) -> list:
+    """Validate an exam file parsed in one go. Returns schema error messages."""
+    exam = orjson.loads(file_path.read_bytes())
+    
+    if not isinstance(exam, dict):
+        return ["exam must be an object"]
+    if not REQUIRED_EXAM_KEYS <= exam.keys():
+        return [f"missing required fields: {', '.join(sorted(REQUIRED_EXAM_KEYS - exam.keys()))}"]
+    
+    errors = _schema_errors("exam", exam)
+    if not errors:
+        # The schema pass guarantees the structure, so flatten the
+        # questions once and derive every count from that list
+        _add_question_stats(
+            [question for section in exam["sections"] for question in section["questions"]],
+            stats, warnings
+        )
+    return errors
+
+
+def _check_exam_stream(file_path: Path, stats: dict, warnings: list) -> list:
+    """
+    Validate a large exam file while streaming it with ijson.
+    
+    Each item of "sections" is built, validated against SECTION_SCHEMA and
+    folded into the stats before the next one is read. The other top-level
+    fields are validated against EXAM_SCHEMA at the end, with the sections
+    already checked. Returns schema error messages.
+    """
+    errors = []
+    header = {}
+    builder = None
+    target = None
+    
+    with open(file_path, "rb") as f:
+        events = ijson.parse(f, use_float=True)
+        if next(events)[1] != "start_map":
+            return ["exam must be an object"]
+        
+        for prefix, event, value in events:
+            if builder is None:
+                # Top-level keys and the sections array itself carry no data
+                if prefix == "" or (prefix == "sections" and event in ("start_array", "end_array")):
+                    if prefix == "sections" and event == "start_array":
+                        header["sections"] = []
+                    continue
+                builder = ijson.ObjectBuilder()
+                target = prefix
+            
+            builder.event(event, value)
+            
+            # A value is complete on its scalar event or when its container
+            # closes; the keys of an object share the object's own prefix
+            if prefix != target or event in ("start_map", "start_array", "map_key"):
+                continue
+            
+            if target == "sections.item":
+                errors.extend(_schema_errors("section", builder.value))
+                if not errors:
+                    _add_question_stats(builder.value["questions"], stats, warnings)
+            else:
+                header[target] = builder.value
+            builder = None
+    
+    if not REQUIRED_EXAM_KEYS <= header.keys():
+        errors.append(f"missing required fields: {', '.join(sorted(REQUIRED_EXAM_KEYS - header.keys()))}")
+    else:
+        errors.extend(_schema_errors("exam", header))
+    return errors
+
 
 def validate_exam_file(file_path: Path) -> dict:
     """
@@ -77,50 +310,35 @@ def validate_exam_file(file_path: Path) -> dict:
         "stats": {}
     }
     
+    stats = {
+        "totalQuestions": 0,
+        "withAnswers": 0,
+        "withExplanations": 0,
+        "emptyOptions": 0,
+    }
+    warnings = []
+    
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            exam = json.load(f)
+        if file_path.stat().st_size > STREAMING_THRESHOLD_BYTES:
+            schema_errors = _check_exam_stream(file_path, stats, warnings)
+        else:
+            schema_errors = _check_exam(file_path, stats, warnings)
         
-        # Schema validation
-        validate(exam, EXAM_SCHEMA)
+        if schema_errors:
+            result["errors"].extend(f"Schema validation failed: {message}" for message in schema_errors)
+            return result
         result["valid"] = True
         
         # Quality checks
-        total_questions = 0
-        questions_with_answers = 0
-        questions_with_explanations = 0
-        empty_options = 0
-        
-        for section in exam.get("sections", []):
-            for question in section.get("questions", []):
-                total_questions += 1
-                
-                if question.get("correctAnswer"):
-                    questions_with_answers += 1
-                else:
-                    result["warnings"].append(f"Q{question['number']}: Missing correct answer")
-                
-                if question.get("explanation"):
-                    questions_with_explanations += 1
-                
-                for opt in question.get("options", []):
-                    if not opt.get("text"):
-                        empty_options += 1
+        total_questions = stats["totalQuestions"]
+        stats["answerCoverage"] = stats["withAnswers"] / total_questions if total_questions else 0.0
+        result["stats"] = stats
         
-        result["stats"] = {
-            "totalQuestions": total_questions,
-            "withAnswers": questions_with_answers,
-            "withExplanations": questions_with_explanations,
-            "emptyOptions": empty_options,
-            "answerCoverage": f"{(questions_with_answers / total_questions * 100):.1f}%" if total_questions > 0 else "0%"
-        }
-        
-        if empty_options > 0:
-            result["warnings"].append(f"{empty_options} empty option texts found")
+        result["warnings"].extend(warnings)
+        if stats["emptyOptions"] > 0:
+            result["warnings"].append(("empty_options", stats["emptyOptions"]))
         
-    except ValidationError as e:
-        result["errors"].append(f"Schema validation failed: {e.message}")
-    except json.JSONDecodeError as e:
+    except (orjson.JSONDecodeError, ijson.JSONError) as e:
         result["errors"].append(f"Invalid JSON: {e}")
     except Exception as e:
         result["errors"].append(f"Error: {e}")
@@ -128,6 +346,27 @@ def validate_exam_file(file_path: Path) -> dict:
     return result
 
 
+def format_result(result: dict) -> str:
+    """Render one file's validation report, followed by a blank line."""
+    status = "✓" if result["valid"] else "✗"
+    lines = [f"{status} {result['file']}"]
+    
+    if result["stats"]:
+        stats = result["stats"]
+        lines.append(f"   Questions: {stats['totalQuestions']}, Answers: {stats['answerCoverage'] * 100:.1f}%")
+    
+    for error in result["errors"]:
+        lines.append(f"   ✗ {error}")
+    
+    for kind, value in result["warnings"][:3]:  # Limit warnings shown
+        lines.append(f"   ⚠ {WARNING_MESSAGES[kind].format(value)}")
+    if len(result["warnings"]) > 3:
+        lines.append(f"   ... and {len(result['warnings']) - 3} more warnings")
+    
+    lines.append("")
+    return "\n".join(lines) + "\n"
+
+
 def main():
     parser = argparse.ArgumentParser(description="Validate exam JSON files")
     parser.add_argument("input_dir", help="Directory containing parsed exam JSON")
@@ -135,7 +374,10 @@ def main():
     args = parser.parse_args()
     
     input_path = Path(args.input_dir)
-    json_files = [f for f in input_path.glob("*.json") if f.name != "index.json"]
+    json_files = [
+        Path(entry.path) for entry in os.scandir(input_path)
+        if entry.is_file() and entry.name.endswith(".json") and entry.name != "index.json"
+    ]
     
     print(f"Validating {len(json_files)} exam files...\n")
     
@@ -143,35 +385,30 @@ def main():
     total_questions = 0
     total_with_answers = 0
     
-    for json_file in json_files:
-        result = validate_exam_file(json_file)
-        
-        status = "✓" if result["valid"] else "✗"
-        print(f"{status} {result['file']}")
+    # Files validate independently; each worker compiles the validator once
+    # on first use and reuses it for the rest of its files
+    with ProcessPoolExecutor() as executor:
+        results = list(executor.map(validate_exam_file, json_files, chunksize=4))
+    
+    for result in results:
+        # One write per file instead of one print per line
+        sys.stdout.write(format_result(result))
         
         if result["stats"]:
-            stats = result["stats"]
-            print(f"   Questions: {stats['totalQuestions']}, Answers: {stats['answerCoverage']}")
-            total_questions += stats["totalQuestions"]
-            total_with_answers += stats["withAnswers"]
-        
-        for error in result["errors"]:
-            print(f"   ✗ {error}")
-        
-        for warning in result["warnings"][:3]:  # Limit warnings shown
-            print(f"   ⚠ {warning}")
-        if len(result["warnings"]) > 3:
-            print(f"   ... and {len(result['warnings']) - 3} more warnings")
+            total_questions += result["stats"]["totalQuestions"]
+            total_with_answers += result["stats"]["withAnswers"]
         
         if not result["valid"] or (args.strict and result["warnings"]):
             all_valid = False
-        
-        print()
     
     # Summary
     print("=" * 50)
     print(f"Total questions: {total_questions}")
-    print(f"With answers: {total_with_answers} ({total_with_answers/total_questions*100:.1f}%)" if total_questions > 0 else "")
+    if total_questions > 0:
+        answer_pct = total_with_answers / total_questions * 100
+        print(f"With answers: {total_with_answers} ({answer_pct:.1f}%)")
+    else:
+        print()
     print(f"Overall: {'✓ All valid' if all_valid else '✗ Some issues found'}")
     
     return 0 if all_valid else 1